@@ -6,13 +6,17 @@ Incluye gestión de usuarios, estaciones, cargadores, sesiones y mantenimientos.
 """
 
 from __future__ import annotations
-from typing import List
+import time
+from typing import Dict, Hashable, List, Optional, Tuple
 from uuid import UUID
-from fastapi import FastAPI, HTTPException, Depends, status
+from fastapi import FastAPI, HTTPException, Depends, Request, status
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from datetime import timedelta
 
-# Servicios
+# Modelos y servicios
+from models.session import KWH_POR_MINUTO, Session
+from models.user import User
 from services.service import ChargingService
 from services.auth_service import (
     create_access_token, 
@@ -48,18 +52,48 @@ from schemas.maintenance_schemas import (
 app = FastAPI(
     title="VoltEdge API",
     description="API REST para gestión de sistema de carga de vehículos eléctricos",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 voltedge_service = ChargingService()
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/token")
 
+# ==================== CACHÉ DE ESTACIONES ====================
+
+# Las vistas públicas de estaciones se sirven desde caché durante unos segundos
+STATIONS_CACHE_TTL_SECONDS = 2.0
+_stations_cache: Dict[Hashable, Tuple[float, object]] = {}
+
+
+def _get_cached_station_view(key: Hashable) -> Optional[object]:
+    """Devuelve una respuesta de estaciones cacheada si no ha caducado."""
+    cached = _stations_cache.get(key)
+    if cached is not None and time.monotonic() < cached[0]:
+        return cached[1]
+    return None
+
+
+def _store_station_view(key: Hashable, value: object) -> None:
+    """Guarda una respuesta de estaciones en la caché."""
+    _stations_cache[key] = (time.monotonic() + STATIONS_CACHE_TTL_SECONDS, value)
+
+
+def _invalidate_stations_cache() -> None:
+    """Vacía la caché tras cualquier cambio en estaciones, cargadores o sesiones."""
+    _stations_cache.clear()
+
+
 # ==================== DEPENDENCIAS ====================
 
-async def get_current_user(token: str = Depends(oauth2_scheme)) -> UsuarioAutenticado:
+def get_authenticated_user(request: Request, token: str = Depends(oauth2_scheme)) -> User:
     """
-    Dependencia que extrae y valida el usuario actual desde el token JWT.
+    Dependencia que resuelve el User del modelo a partir del token JWT.
+    
+    FastAPI ya ejecuta la dependencia una sola vez por petición; además deja
+    el User en request.state.user para los endpoints que necesitan el objeto
+    completo y no solo el esquema.
     """
     email = decode_access_token(token)
     
@@ -79,22 +113,23 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> UsuarioAutent
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    return UsuarioAutenticado(
-        id=user.id,
-        name=user.name,
-        email=user.email,
-        user_type=user.user_type,
-        saldo=user.saldo
-    )
+    request.state.user = user
+    
+    return user
 
 
-async def get_current_admin(current_user: UsuarioAutenticado = Depends(get_current_user)) -> UsuarioAutenticado:
+def get_current_user(user: User = Depends(get_authenticated_user)) -> UsuarioAutenticado:
+    """
+    Dependencia que devuelve el usuario actual como esquema validado.
+    """
+    return UsuarioAutenticado.model_validate(user)
+
+
+def get_current_admin(current_user: UsuarioAutenticado = Depends(get_current_user)) -> UsuarioAutenticado:
     """
     Dependencia que verifica que el usuario actual es administrador.
     """
-    user = voltedge_service.get_user_by_id(current_user.id)
-    
-    if not user or not user.is_admin():
+    if not current_user.is_admin:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="No tienes permisos de administrador para realizar esta acción"
@@ -103,6 +138,46 @@ async def get_current_admin(current_user: UsuarioAutenticado = Depends(get_curre
     return current_user
 
 
+# ==================== CONSTRUCCIÓN DE RESPUESTAS ====================
+
+# Campos de /auth/me, tomados del esquema para que no se desincronicen
+_USUARIO_AUTENTICADO_FIELDS = tuple(UsuarioAutenticado.model_fields)
+
+def _session_fields(session: Session, user: User, tarifa: float) -> dict:
+    """
+    Campos de SessionRead para una sesión (duración, kWh y coste calculados).
+    
+    Recibe el usuario y su tarifa ya resueltos para que los listados puedan
+    calcularlos una sola vez fuera del bucle. Las sesiones finalizadas usan
+    el consumo y el coste fijados al cerrarlas.
+    """
+    duracion = session.get_duration()
+    if session.coste is not None:
+        kwh = session.kwh_consumidos
+        coste = session.coste
+    else:
+        kwh = duracion * KWH_POR_MINUTO
+        coste = kwh * tarifa
+    
+    return {
+        "user_id": user.id,
+        "user_name": user.name,
+        "charger_id": session.charger.id,
+        "start_time": session.start_time_str,
+        "end_time": session.end_time_str,
+        "duration_minutes": duracion,
+        "kwh_consumidos": kwh,
+        "coste": coste,
+        "activa": session.end_time is None
+    }
+
+
+def _build_session_read(session: Session) -> SessionRead:
+    """Construye el SessionRead de una sesión sin revalidar datos propios."""
+    user = session.user
+    return SessionRead.model_construct(**_session_fields(session, user, user.get_tarifa()))
+
+
 # ==================== ENDPOINT RAÍZ ====================
 
 @app.get("/", tags=["General"])
@@ -175,11 +250,13 @@ def login(form_data: OAuth2PasswordRequestForm = Depends()) -> Token:
 
 
 @app.get("/auth/me", response_model=UsuarioAutenticado, tags=["Autenticación"])
-def obtener_usuario_actual(current_user: UsuarioAutenticado = Depends(get_current_user)) -> UsuarioAutenticado:
+def obtener_usuario_actual(user: User = Depends(get_authenticated_user)) -> Response:
     """
     Obtiene la información del usuario autenticado actualmente.
     """
-    return current_user
+    # Se serializa directamente desde el User sin pasar por Pydantic; los campos
+    # salen del propio esquema, que además documenta la respuesta
+    return ORJSONResponse({field: getattr(user, field) for field in _USUARIO_AUTENTICADO_FIELDS})
 
 
 # ==================== USUARIOS ====================
@@ -191,19 +268,7 @@ def listar_usuarios() -> List[UserRead]:
     
     **Requiere:** Autenticación + Permisos de Admin
     """
-    users = list(voltedge_service.users.values())
-    
-    return [
-        UserRead(
-            id=u.id,
-            name=u.name,
-            email=u.email,
-            user_type=u.user_type,
-            saldo=u.saldo,
-            tarifa_kwh=u.get_tarifa()
-        )
-        for u in users
-    ]
+    return [UserRead.model_validate(u) for u in voltedge_service.users.values()]
 
 
 @app.get("/users/{user_id}", response_model=UserRead, tags=["Usuarios"])
@@ -219,17 +284,10 @@ def obtener_usuario(user_id: UUID, current_user: UsuarioAutenticado = Depends(ge
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Usuario no encontrado")
     
     # Solo admin o el propio usuario pueden ver la info
-    if user.id != current_user.id and not voltedge_service.get_user_by_id(current_user.id).is_admin():
+    if user.id != current_user.id and not current_user.is_admin:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="No tienes permiso para ver este usuario")
     
-    return UserRead(
-        id=user.id,
-        name=user.name,
-        email=user.email,
-        user_type=user.user_type,
-        saldo=user.saldo,
-        tarifa_kwh=user.get_tarifa()
-    )
+    return UserRead.model_validate(user)
 
 
 @app.post("/users/{user_id}/recargar-saldo", response_model=RecargaSaldoResponse, tags=["Usuarios"])
@@ -270,38 +328,29 @@ def recargar_saldo(
 def obtener_historial_sesiones(
     user_id: UUID, 
     current_user: UsuarioAutenticado = Depends(get_current_user)
-) -> List[SessionRead]:
+) -> Response:
     """
     Obtiene el historial de sesiones de carga de un usuario.
     
     **Requiere:** Autenticación (solo puede ver su propio historial o admin)
+    
+    Las filas se construyen ya con la forma de SessionRead y se serializan
+    directamente con orjson, sin validar cada una con Pydantic.
     """
     # Solo puede ver su propio historial o admin
-    if user_id != current_user.id and not voltedge_service.get_user_by_id(current_user.id).is_admin():
+    if user_id != current_user.id and not current_user.is_admin:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="No tienes permiso para ver este historial")
     
     sessions = voltedge_service.get_user_sessions_history(user_id)
     
-    resultado = []
-    for s in sessions:
-        duracion = s.get_duration()
-        kwh = duracion * 0.5
-        tarifa = s.user.get_tarifa()
-        coste = kwh * tarifa
-        
-        resultado.append(SessionRead(
-            user_id=s.user.id,
-            user_name=s.user.name,
-            charger_id=s.charger.id,
-            start_time=s.start_time.strftime("%Y-%m-%d %H:%M:%S"),
-            end_time=s.end_time.strftime("%Y-%m-%d %H:%M:%S") if s.end_time else None,
-            duration_minutes=duracion,
-            kwh_consumidos=kwh,
-            coste=coste,
-            activa=s.end_time is None
-        ))
+    if not sessions:
+        return ORJSONResponse([])
     
-    return resultado
+    # Todas las sesiones del historial son del mismo usuario: datos fuera del bucle
+    user = sessions[0].user
+    tarifa = user.get_tarifa()
+    
+    return ORJSONResponse([_session_fields(s, user, tarifa) for s in sessions])
 
 
 # ==================== ESTACIONES ====================
@@ -314,17 +363,15 @@ def crear_estacion(station: StationCreate) -> StationRead:
     **Requiere:** Autenticación + Permisos de Admin
     """
     created_station = voltedge_service.create_station(station.id, station.name, station.location)
+    _invalidate_stations_cache()
     
     return StationRead(
         id=created_station.id,
         name=created_station.name,
         location=created_station.location,
         total_chargers=len(created_station.chargers),
-        disponibles=len(created_station.get_available_chargers()),
-        chargers=[
-            ChargerInfo(id=c.id, type=c.type, status=c.status)
-            for c in created_station.chargers
-        ]
+        disponibles=created_station.count_available(),
+        chargers=[ChargerInfo.model_validate(c) for c in created_station.chargers]
     )
 
 
@@ -335,22 +382,26 @@ def listar_estaciones() -> List[StationRead]:
     
     **No requiere autenticación** (información pública)
     """
+    cached = _get_cached_station_view("stations")
+    if cached is not None:
+        return cached
+    
     stations = voltedge_service.list_stations()
     
-    return [
+    resultado = [
         StationRead(
             id=s.id,
             name=s.name,
             location=s.location,
             total_chargers=len(s.chargers),
-            disponibles=len(s.get_available_chargers()),
-            chargers=[
-                ChargerInfo(id=c.id, type=c.type, status=c.status)
-                for c in s.chargers
-            ]
+            disponibles=s.count_available(),
+            chargers=[ChargerInfo.model_validate(c) for c in s.chargers]
         )
         for s in stations
     ]
+    
+    _store_station_view("stations", resultado)
+    return resultado
 
 
 @app.get("/stations/{station_id}", response_model=StationRead, tags=["Estaciones"])
@@ -360,22 +411,26 @@ def obtener_estacion(station_id: int) -> StationRead:
     
     **No requiere autenticación** (información pública)
     """
+    cached = _get_cached_station_view(("station", station_id))
+    if cached is not None:
+        return cached
+    
     station = voltedge_service.get_station(station_id)
     
     if not station:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Estación no encontrada")
     
-    return StationRead(
+    resultado = StationRead(
         id=station.id,
         name=station.name,
         location=station.location,
         total_chargers=len(station.chargers),
-        disponibles=len(station.get_available_chargers()),
-        chargers=[
-            ChargerInfo(id=c.id, type=c.type, status=c.status)
-            for c in station.chargers
-        ]
+        disponibles=station.count_available(),
+        chargers=[ChargerInfo.model_validate(c) for c in station.chargers]
     )
+    
+    _store_station_view(("station", station_id), resultado)
+    return resultado
 
 
 @app.delete("/stations/{station_id}", status_code=status.HTTP_204_NO_CONTENT, tags=["Estaciones"], dependencies=[Depends(get_current_admin)])
@@ -387,6 +442,8 @@ def eliminar_estacion(station_id: int):
     """
     if not voltedge_service.delete_station(station_id):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Estación no encontrada")
+    
+    _invalidate_stations_cache()
 
 
 @app.get("/stations/{station_id}/disponibilidad", response_model=StationDisponibilidad, tags=["Estaciones"])
@@ -395,13 +452,22 @@ def obtener_disponibilidad_estacion(station_id: int) -> StationDisponibilidad:
     Obtiene la disponibilidad en tiempo real de una estación.
     
     **No requiere autenticación** (información pública)
+    
+    La respuesta puede tener hasta STATIONS_CACHE_TTL_SECONDS de antigüedad.
     """
+    cached = _get_cached_station_view(("disponibilidad", station_id))
+    if cached is not None:
+        return cached
+    
     data = voltedge_service.get_station_disponibilidad(station_id)
     
     if "error" in data:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=data["error"])
     
-    return StationDisponibilidad(**data)
+    resultado = StationDisponibilidad.model_validate(data)
+    
+    _store_station_view(("disponibilidad", station_id), resultado)
+    return resultado
 
 
 @app.get("/stations/{station_id}/reporte-consumo", response_model=StationConsumo, tags=["Estaciones"], dependencies=[Depends(get_current_admin)])
@@ -416,7 +482,7 @@ def obtener_reporte_consumo(station_id: int) -> StationConsumo:
     if "error" in data:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=data["error"])
     
-    return StationConsumo(**data)
+    return StationConsumo.model_validate(data)
 
 
 # ==================== CARGADORES ====================
@@ -429,15 +495,12 @@ def añadir_cargador(station_id: int, charger: ChargerCreate) -> ChargerRead:
     **Requiere:** Autenticación + Permisos de Admin
     """
     created_charger = voltedge_service.add_charger_to_station(station_id, charger.charger_id, charger.charger_type)
+    _invalidate_stations_cache()
     
     if not created_charger:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Estación no encontrada")
     
-    return ChargerRead(
-        id=created_charger.id,
-        type=created_charger.type,
-        status=created_charger.status
-    )
+    return ChargerRead.model_validate(created_charger)
 
 
 @app.get("/chargers", response_model=List[ChargerRead], tags=["Cargadores"])
@@ -449,10 +512,7 @@ def listar_cargadores() -> List[ChargerRead]:
     """
     chargers = voltedge_service.list_chargers()
     
-    return [
-        ChargerRead(id=c.id, type=c.type, status=c.status)
-        for c in chargers
-    ]
+    return [ChargerRead.model_validate(c) for c in chargers]
 
 
 @app.get("/chargers/{charger_id}", response_model=ChargerRead, tags=["Cargadores"])
@@ -467,7 +527,7 @@ def obtener_cargador(charger_id: int) -> ChargerRead:
     if not charger:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Cargador no encontrado")
     
-    return ChargerRead(id=charger.id, type=charger.type, status=charger.status)
+    return ChargerRead.model_validate(charger)
 
 
 # ==================== SESIONES ====================
@@ -483,6 +543,7 @@ def iniciar_sesion_simple(station_id: int, current_user: UsuarioAutenticado = De
     Ejemplo: POST /sessions/iniciar-simple?station_id=1
     """
     session = voltedge_service.start_charging(current_user.id, station_id)
+    _invalidate_stations_cache()
     
     if not session:
         raise HTTPException(
@@ -490,26 +551,11 @@ def iniciar_sesion_simple(station_id: int, current_user: UsuarioAutenticado = De
             detail="No se pudo iniciar la sesión. Verifica disponibilidad de cargadores."
         )
     
-    duracion = session.get_duration()
-    kwh = duracion * 0.5
-    tarifa = session.user.get_tarifa()
-    coste = kwh * tarifa
-    
-    return SessionRead(
-        user_id=session.user.id,
-        user_name=session.user.name,
-        charger_id=session.charger.id,
-        start_time=session.start_time.strftime("%Y-%m-%d %H:%M:%S"),
-        end_time=None,
-        duration_minutes=duracion,
-        kwh_consumidos=kwh,
-        coste=coste,
-        activa=True
-    )
+    return _build_session_read(session)
 
 
 @app.post("/sessions/finalizar-simple", response_model=SessionRead, tags=["Sesiones"])
-def finalizar_sesion_simple(current_user: UsuarioAutenticado = Depends(get_current_user)) -> SessionRead:
+def finalizar_sesion_simple(request: Request, current_user: UsuarioAutenticado = Depends(get_current_user)) -> SessionRead:
     """
     Finaliza la sesión de carga activa del usuario autenticado.
     
@@ -518,9 +564,9 @@ def finalizar_sesion_simple(current_user: UsuarioAutenticado = Depends(get_curre
     
     Ejemplo: POST /sessions/finalizar-simple
     """
-    user = voltedge_service.get_user_by_id(current_user.id)
+    user = request.state.user
     
-    if not user or not user.active_session:
+    if not user.active_session:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, 
             detail="No tienes ninguna sesión activa"
@@ -528,23 +574,9 @@ def finalizar_sesion_simple(current_user: UsuarioAutenticado = Depends(get_curre
     
     session = user.active_session
     voltedge_service.end_charging(current_user.id)
+    _invalidate_stations_cache()
     
-    duracion = session.get_duration()
-    kwh = duracion * 0.5
-    tarifa = user.get_tarifa()
-    coste = kwh * tarifa
-    
-    return SessionRead(
-        user_id=user.id,
-        user_name=user.name,
-        charger_id=session.charger.id,
-        start_time=session.start_time.strftime("%Y-%m-%d %H:%M:%S"),
-        end_time=session.end_time.strftime("%Y-%m-%d %H:%M:%S") if session.end_time else None,
-        duration_minutes=duracion,
-        kwh_consumidos=kwh,
-        coste=coste,
-        activa=False
-    )
+    return _build_session_read(session)
 
 
 @app.post("/sessions/iniciar", response_model=SessionRead, status_code=status.HTTP_201_CREATED, tags=["Sesiones"])
@@ -559,15 +591,14 @@ def crear_sesion(session_data: SessionCreate, current_user: UsuarioAutenticado =
     """
     # Usar el user_id del usuario autenticado si no se proporciona o no coincide
     # Los admins pueden iniciar sesiones para otros usuarios
-    user_actual = voltedge_service.get_user_by_id(current_user.id)
-    
-    if not user_actual.is_admin() and session_data.user_id != current_user.id:
+    if not current_user.is_admin and session_data.user_id != current_user.id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN, 
             detail="Solo puedes iniciar sesiones para ti mismo"
         )
     
     session = voltedge_service.start_charging(session_data.user_id, session_data.station_id)
+    _invalidate_stations_cache()
     
     if not session:
         raise HTTPException(
@@ -575,22 +606,7 @@ def crear_sesion(session_data: SessionCreate, current_user: UsuarioAutenticado =
             detail="No se pudo iniciar la sesión. Verifica disponibilidad de cargadores."
         )
     
-    duracion = session.get_duration()
-    kwh = duracion * 0.5
-    tarifa = session.user.get_tarifa()
-    coste = kwh * tarifa
-    
-    return SessionRead(
-        user_id=session.user.id,
-        user_name=session.user.name,
-        charger_id=session.charger.id,
-        start_time=session.start_time.strftime("%Y-%m-%d %H:%M:%S"),
-        end_time=None,
-        duration_minutes=duracion,
-        kwh_consumidos=kwh,
-        coste=coste,
-        activa=True
-    )
+    return _build_session_read(session)
 
 
 @app.post("/sessions/cerrar", response_model=SessionRead, tags=["Sesiones"])
@@ -605,9 +621,7 @@ def cerrar_sesion(close_data: CerrarSessionRequest, current_user: UsuarioAutenti
     """
     # Usar el user_id del usuario autenticado si no se proporciona o no coincide
     # Los admins pueden cerrar sesiones para otros usuarios
-    user_actual = voltedge_service.get_user_by_id(current_user.id)
-    
-    if not user_actual.is_admin() and close_data.user_id != current_user.id:
+    if not current_user.is_admin and close_data.user_id != current_user.id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN, 
             detail="Solo puedes cerrar tu propia sesión"
@@ -623,23 +637,9 @@ def cerrar_sesion(close_data: CerrarSessionRequest, current_user: UsuarioAutenti
     
     session = user.active_session
     voltedge_service.end_charging(close_data.user_id)
+    _invalidate_stations_cache()
     
-    duracion = session.get_duration()
-    kwh = duracion * 0.5
-    tarifa = user.get_tarifa()
-    coste = kwh * tarifa
-    
-    return SessionRead(
-        user_id=user.id,
-        user_name=user.name,
-        charger_id=session.charger.id,
-        start_time=session.start_time.strftime("%Y-%m-%d %H:%M:%S"),
-        end_time=session.end_time.strftime("%Y-%m-%d %H:%M:%S") if session.end_time else None,
-        duration_minutes=duracion,
-        kwh_consumidos=kwh,
-        coste=coste,
-        activa=False
-    )
+    return _build_session_read(session)
 
 
 # ==================== MANTENIMIENTOS ====================
@@ -678,42 +678,22 @@ def programar_mantenimiento(maintenance_data: MaintenanceCreate) -> MaintenanceR
     else:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Tipo de mantenimiento inválido. Usa 'preventivo' o 'correctivo'")
     
-    return MaintenanceRead(
-        id_mantenimiento=maintenance.id_mantenimiento,
-        station_id=maintenance.estacion_id,
-        fecha=maintenance.fecha.strftime("%Y-%m-%d"),
-        tecnico=maintenance.tecnico,
-        tipo=maintenance.tipo,
-        estado=maintenance.estado,
-        notas=maintenance.notas,
-        frecuencia=getattr(maintenance, 'frecuencia', None),
-        descripcion_fallo=getattr(maintenance, 'descripcion_fallo', None)
-    )
+    return MaintenanceRead.model_validate(maintenance.to_read_dict())
 
 
 @app.get("/maintenance", response_model=List[MaintenanceRead], tags=["Mantenimiento"], dependencies=[Depends(get_current_admin)])
-def listar_mantenimientos(station_id: int = None) -> List[MaintenanceRead]:
+def listar_mantenimientos(station_id: Optional[int] = None) -> Response:
     """
     Lista todos los mantenimientos o filtra por estación.
     
     **Requiere:** Autenticación + Permisos de Admin
+    
+    to_read_dict() ya devuelve la forma de MaintenanceRead, así que la lista
+    se serializa directamente con orjson sin validar cada fila.
     """
     maintenances = voltedge_service.listar_mantenimientos(station_id)
     
-    return [
-        MaintenanceRead(
-            id_mantenimiento=m.id_mantenimiento,
-            station_id=m.estacion_id,
-            fecha=m.fecha.strftime("%Y-%m-%d") if hasattr(m.fecha, 'strftime') else str(m.fecha),
-            tecnico=m.tecnico,
-            tipo=m.tipo,
-            estado=m.estado,
-            notas=m.notas,
-            frecuencia=getattr(m, 'frecuencia', None),
-            descripcion_fallo=getattr(m, 'descripcion_fallo', None)
-        )
-        for m in maintenances
-    ]
+    return ORJSONResponse([m.to_read_dict() for m in maintenances])
 
 
 @app.post("/maintenance/{id_mantenimiento}/iniciar", response_model=MaintenanceRead, tags=["Mantenimiento"], dependencies=[Depends(get_current_admin)])
@@ -728,17 +708,7 @@ def iniciar_mantenimiento(id_mantenimiento: int) -> MaintenanceRead:
     if not maintenance:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Mantenimiento no encontrado")
     
-    return MaintenanceRead(
-        id_mantenimiento=maintenance.id_mantenimiento,
-        station_id=maintenance.estacion_id,
-        fecha=maintenance.fecha.strftime("%Y-%m-%d"),
-        tecnico=maintenance.tecnico,
-        tipo=maintenance.tipo,
-        estado=maintenance.estado,
-        notas=maintenance.notas,
-        frecuencia=getattr(maintenance, 'frecuencia', None),
-        descripcion_fallo=getattr(maintenance, 'descripcion_fallo', None)
-    )
+    return MaintenanceRead.model_validate(maintenance.to_read_dict())
 
 
 @app.post("/maintenance/{id_mantenimiento}/completar", response_model=MaintenanceRead, tags=["Mantenimiento"], dependencies=[Depends(get_current_admin)])
@@ -753,17 +723,7 @@ def completar_mantenimiento(id_mantenimiento: int, completion_data: CompletarMai
     if not maintenance:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Mantenimiento no encontrado")
     
-    return MaintenanceRead(
-        id_mantenimiento=maintenance.id_mantenimiento,
-        station_id=maintenance.estacion_id,
-        fecha=maintenance.fecha.strftime("%Y-%m-%d"),
-        tecnico=maintenance.tecnico,
-        tipo=maintenance.tipo,
-        estado=maintenance.estado,
-        notas=maintenance.notas,
-        frecuencia=getattr(maintenance, 'frecuencia', None),
-        descripcion_fallo=getattr(maintenance, 'descripcion_fallo', None)
-    )
+    return MaintenanceRead.model_validate(maintenance.to_read_dict())
 
 # ==================== EJECUCIÓN ====================
 
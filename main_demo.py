@@ -8,6 +8,8 @@ Para ejecutar la demo:
     python main_demo.py
 """
 
+import logging
+
 from services.service import ChargingService
 
 def main():
@@ -20,7 +22,6 @@ def main():
 
     # prueba de mantenimiento
     print("\n--- Prueba de Mantenimientos ---")
-    service = ChargingService()  # si no lo tienes aún, usa el objeto service que ya hayas creado
 
     # crear estación para el ejemplo
     station = service.create_station(2, "Estación Norte", "Vigo Norte")
@@ -77,4 +78,6 @@ def main():
     print("\nSimulación completada.")
 
 if __name__ == "__main__":
+    # Los modelos informan de los eventos por logging; en la demo se muestran como texto plano
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     main()
\ No newline at end of file
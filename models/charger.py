@@ -1,19 +1,53 @@
+import logging
+import sys
+from enum import IntEnum
+
+logger = logging.getLogger(__name__)
+
+
+class ChargerStatus(IntEnum):
+    """Estado de un cargador (comparaciones de enteros en vez de cadenas)"""
+    DISPONIBLE = 0
+    OCUPADO = 1
+    MANTENIMIENTO = 2
+
+
+# Nombre expuesto en la API para cada estado
+_STATUS_NAMES = {
+    ChargerStatus.DISPONIBLE: "disponible",
+    ChargerStatus.OCUPADO: "ocupado",
+    ChargerStatus.MANTENIMIENTO: "mantenimiento",
+}
+
+
 class Charger:
-    def __init__(self, id, type, status="available"):
+    __slots__ = ("id", "type", "status_code", "station")
+
+    def __init__(self, id, type, status=ChargerStatus.DISPONIBLE):
         self.id = id
-        self.type = type
-        self.status = status  # disponible / ocupado / mantenimiento
+        self.type = sys.intern(type)  # 'rápido' / 'normal' compartidos entre cargadores
+        self.status_code = status
+        self.station = None  # Estación a la que pertenece (la asigna Station.add_charger)
+
+    @property
+    def status(self):
+        """Estado como texto: disponible / ocupado / mantenimiento"""
+        return _STATUS_NAMES[self.status_code]
 
     def start_charge(self):
-        if self.status == "disponible":
-            self.status = "ocupado"
-            print(f"Cargador {self.id} iniciado.")
+        if self.status_code == ChargerStatus.DISPONIBLE:
+            self.status_code = ChargerStatus.OCUPADO
+            if self.station is not None:
+                self.station.mark_busy(self)
+            logger.info("Cargador %s iniciado.", self.id)
         else:
-            print(f"Cargador {self.id} no está disponible.")
+            logger.warning("Cargador %s no está disponible.", self.id)
 
     def stop_charge(self):
-        if self.status == "ocupado":
-            self.status = "disponible"
-            print(f"Cargador {self.id} liberado.")
+        if self.status_code == ChargerStatus.OCUPADO:
+            self.status_code = ChargerStatus.DISPONIBLE
+            if self.station is not None:
+                self.station.mark_available(self)
+            logger.info("Cargador %s liberado.", self.id)
         else:
-            print(f"Cargador {self.id} no estaba ocupado.")
\ No newline at end of file
+            logger.warning("Cargador %s no estaba ocupado.", self.id)
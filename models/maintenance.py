@@ -1,6 +1,15 @@
+import logging
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
+
 class Maintenance:
+    __slots__ = (
+        "id_mantenimiento", "fecha", "fecha_str", "tecnico", "tipo",
+        "estado", "estacion_id", "notas"
+    )
+
     def __init__(self, id_mantenimiento, fecha, tecnico, tipo):
         """
         fecha: string ISO 'YYYY-MM-DD' o datetime
@@ -14,6 +23,8 @@ class Maintenance:
                 self.fecha = datetime.now()
         else:
             self.fecha = fecha
+        # Fecha ya formateada (YYYY-MM-DD) para las respuestas de la API
+        self.fecha_str = self.fecha.strftime("%Y-%m-%d") if hasattr(self.fecha, "strftime") else str(self.fecha)
         self.tecnico = tecnico
         self.tipo = tipo  # "preventivo" o "correctivo"
         self.estado = "programado"  # programado / en_proceso / completado
@@ -25,16 +36,31 @@ class Maintenance:
 
     def programar(self):
         self.estado = "programado"
-        return f"Mantenimiento {self.id_mantenimiento} programado para {self.fecha.date()} en estación {self.estacion_id}"
+        logger.info("Mantenimiento %s programado para %s en estación %s",
+                    self.id_mantenimiento, self.fecha_str, self.estacion_id)
 
     def iniciar(self):
         self.estado = "en_proceso"
-        return f"Mantenimiento {self.id_mantenimiento} iniciado por {self.tecnico}"
+        logger.info("Mantenimiento %s iniciado por %s", self.id_mantenimiento, self.tecnico)
 
     def marcar_completado(self, notas=""):
         self.estado = "completado"
         self.notas = notas
-        return f"Mantenimiento {self.id_mantenimiento} completado. Notas: {self.notas}"
+        logger.info("Mantenimiento %s completado. Notas: %s", self.id_mantenimiento, self.notas)
+
+    def to_read_dict(self):
+        """Devuelve los campos comunes para la respuesta de la API"""
+        return {
+            "id_mantenimiento": self.id_mantenimiento,
+            "station_id": self.estacion_id,
+            "fecha": self.fecha_str,
+            "tecnico": self.tecnico,
+            "tipo": self.tipo,
+            "estado": self.estado,
+            "notas": self.notas,
+            "frecuencia": None,
+            "descripcion_fallo": None,
+        }
 
     def __str__(self):
         fecha = self.fecha.date() if hasattr(self.fecha, "date") else self.fecha
@@ -42,12 +68,26 @@ class Maintenance:
 
 
 class PreventiveMaintenance(Maintenance):
+    __slots__ = ("frecuencia",)
+
     def __init__(self, id_mantenimiento, fecha, tecnico, frecuencia):
         super().__init__(id_mantenimiento, fecha, tecnico, tipo="preventivo")
         self.frecuencia = frecuencia  # p.ej. "mensual", "trimestral"
 
+    def to_read_dict(self):
+        data = super().to_read_dict()
+        data["frecuencia"] = self.frecuencia
+        return data
+
 
 class CorrectiveMaintenance(Maintenance):
+    __slots__ = ("descripcion_fallo",)
+
     def __init__(self, id_mantenimiento, fecha, tecnico, descripcion_fallo):
         super().__init__(id_mantenimiento, fecha, tecnico, tipo="correctivo")
-        self.descripcion_fallo = descripcion_fallo
\ No newline at end of file
+        self.descripcion_fallo = descripcion_fallo
+
+    def to_read_dict(self):
+        data = super().to_read_dict()
+        data["descripcion_fallo"] = self.descripcion_fallo
+        return data
@@ -1,19 +1,41 @@
 import datetime
+import time
+
+# Simulación de consumo: 0.5 kWh por minuto de carga
+KWH_POR_MINUTO = 0.5
 
 class Session:
+    __slots__ = (
+        "user", "charger", "station_id", "start_time", "end_time",
+        "_start_monotonic", "_end_monotonic", "start_time_str", "end_time_str",
+        "kwh_consumidos", "coste"
+    )
+
     def __init__(self, user, charger):
         self.user = user
         self.charger = charger
+        # Estación del cargador, fijada al iniciar (los reportes filtran por id)
+        self.station_id = charger.station.id if charger.station is not None else None
         self.start_time = datetime.datetime.now()
         self.end_time = None
+        # Reloj monotónico para medir la duración sin crear datetime/timedelta
+        self._start_monotonic = time.monotonic()
+        self._end_monotonic = None
+        # Cadenas ya formateadas para las respuestas de la API
+        self.start_time_str = self.start_time.isoformat(sep=" ", timespec="seconds")
+        self.end_time_str = None
+        # Consumo y coste definitivos, fijados al cerrar la sesión
+        self.kwh_consumidos = None
+        self.coste = None
 
     def end(self):
         """Finaliza la sesión guardando la hora de término"""
         self.end_time = datetime.datetime.now()
+        self._end_monotonic = time.monotonic()
+        self.end_time_str = self.end_time.isoformat(sep=" ", timespec="seconds")
+        self.kwh_consumidos = self.get_duration() * KWH_POR_MINUTO
 
     def get_duration(self):
         """Devuelve la duración en minutos"""
-        if self.end_time:
-            return (self.end_time - self.start_time).seconds // 60
-        else:
-            return (datetime.datetime.now() - self.start_time).seconds // 60
\ No newline at end of file
+        end = self._end_monotonic if self._end_monotonic is not None else time.monotonic()
+        return int(end - self._start_monotonic) // 60
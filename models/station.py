@@ -1,26 +1,58 @@
-from .charger import Charger
+from .charger import Charger, ChargerStatus
 
 class Station:
+    __slots__ = ("id", "name", "location", "chargers", "_available", "_busy")
+
     def __init__(self, id, name, location):
         self.id = id
         self.name = name
         self.location = location
         self.chargers = []
+        # Cargadores disponibles como conjunto ordenado (dict sin valores):
+        # añadir, quitar y tomar el primero son O(1)
+        self._available = {}
+        # Cargadores ocupados (se actualiza en cada transición, sin recorrer la lista)
+        self._busy = 0
 
     def add_charger(self, charger):
         """Agrega un cargador a la estación"""
         self.chargers.append(charger)
+        charger.station = self
+        if charger.status_code == ChargerStatus.DISPONIBLE:
+            self._available[charger] = None
+        elif charger.status_code == ChargerStatus.OCUPADO:
+            self._busy += 1
+
+    def mark_available(self, charger):
+        """Registra que un cargador ocupado de la estación ha quedado libre"""
+        self._available[charger] = None
+        self._busy -= 1
+
+    def mark_busy(self, charger):
+        """Registra que un cargador libre de la estación ha pasado a ocupado"""
+        self._available.pop(charger, None)
+        self._busy += 1
 
     def get_available_chargers(self):
         """Devuelve una lista de cargadores disponibles"""
-        return [c for c in self.chargers if c.status == "available"]
+        return list(self._available)
+
+    def first_available_charger(self):
+        """Devuelve el primer cargador disponible (o None) sin construir la lista"""
+        return next(iter(self._available), None)
+
+    def count_available(self):
+        """Devuelve cuántos cargadores están disponibles sin construir la lista"""
+        return len(self._available)
+
+    def count_busy(self):
+        """Devuelve cuántos cargadores están ocupados sin recorrer la lista"""
+        return self._busy
 
     def reserve_charger(self):
         """Reserva el primer cargador disponible, si existe"""
-        disponible = self.get_available_chargers()
-        if disponible:
-            charger = disponible[0]
-            charger.status = "ocupado"
-            return charger
-        return None
-    
\ No newline at end of file
+        charger = next(iter(self._available), None)
+        if charger is not None:
+            charger.status_code = ChargerStatus.OCUPADO
+            self.mark_busy(charger)
+        return charger
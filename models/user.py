@@ -4,9 +4,22 @@ models/user.py - VoltEdge
 Clase User actualizada para incluir autenticación con contraseña hasheada.
 """
 
+import logging
+import sys
 from uuid import uuid4, UUID
 from typing import Optional
 from .session import Session
+from .charger import ChargerStatus
+
+logger = logging.getLogger(__name__)
+
+# Tarifa en €/kWh según el tipo de usuario (los tipos no listados pagan la general)
+TARIFA_GENERAL = 0.30
+_TARIFAS: dict[str, float] = {
+    "individual": TARIFA_GENERAL,
+    "empresa": 0.25,
+    "admin": TARIFA_GENERAL,
+}
 
 
 class User:
@@ -21,8 +34,15 @@ class User:
         user_type (str): Tipo de usuario ('individual' o 'empresa')
         active_session (Session): Sesión de carga activa (si existe)
         saldo (float): Saldo disponible en la cuenta
+        total_kwh (float): kWh consumidos en todas las sesiones finalizadas
+        total_gastado (float): Importe cobrado en todas las sesiones finalizadas
     """
     
+    __slots__ = (
+        "id", "name", "email", "password_hash", "_user_type", "_tarifa",
+        "active_session", "saldo", "sessions_history", "total_kwh", "total_gastado"
+    )
+    
     def __init__(
         self, 
         name: str, 
@@ -36,10 +56,25 @@ class User:
         self.name: str = name
         self.email: str = email
         self.password_hash: str = password_hash
-        self.user_type: str = user_type  # "individual" o "empresa"
+        self.user_type = user_type  # "individual" o "empresa" (calcula también la tarifa)
         self.active_session: Optional[Session] = None
         self.saldo: float = saldo
         self.sessions_history: list[Session] = []
+        # Totales acumulados del historial (evitan recorrerlo para estadísticas)
+        self.total_kwh: float = 0.0
+        self.total_gastado: float = 0.0
+
+    @property
+    def user_type(self) -> str:
+        """Tipo de usuario: 'individual', 'empresa' o 'admin'"""
+        return self._user_type
+
+    @user_type.setter
+    def user_type(self, value: str) -> None:
+        """Cambia el tipo de usuario y recalcula su tarifa"""
+        # Internado: todos los usuarios del mismo tipo comparten la misma cadena
+        self._user_type: str = sys.intern(value)
+        self._tarifa: float = _TARIFAS.get(value, TARIFA_GENERAL)
 
     def is_admin(self) -> bool:
         """Indica si el usuario es administrador"""
@@ -50,10 +85,15 @@ class User:
         Devuelve la tarifa por kWh según el tipo de usuario.
         - Individual: 0.30€/kWh
         - Empresa: 0.25€/kWh (5€ de descuento)
+        
+        Se precalcula al asignar user_type, así que aquí solo se lee.
         """
-        if self.user_type == "empresa":
-            return 0.25
-        return 0.30
+        return self._tarifa
+
+    @property
+    def tarifa_kwh(self) -> float:
+        """Tarifa por kWh (alias de get_tarifa para serializar con from_attributes)"""
+        return self.get_tarifa()
 
     def recargar_saldo(self, cantidad: float) -> bool:
         """Añade saldo a la cuenta del usuario"""
@@ -75,13 +115,13 @@ class User:
 
     def start_session(self, charger):
         """Inicia una sesión si el cargador está disponible"""
-        if charger.status == "disponible" or charger.status == "available":
+        if charger.status_code == ChargerStatus.DISPONIBLE:
             charger.start_charge()
             self.active_session = Session(self, charger)
-            print(f"{self.name} comenzó una sesión en el cargador {charger.id}")
+            logger.info("%s comenzó una sesión en el cargador %s", self.name, charger.id)
             return self.active_session
         else:
-            print(f"El cargador {charger.id} no está disponible.")
+            logger.warning("El cargador %s no está disponible.", charger.id)
             return None
 
     def end_session(self):
@@ -90,24 +130,26 @@ class User:
             self.active_session.end()
             
             # Calcular y cobrar
-            duracion_minutos = self.active_session.get_duration()
-            kwh_consumidos = duracion_minutos * 0.5  # Simulación: 0.5 kWh/min
+            kwh_consumidos = self.active_session.kwh_consumidos
             tarifa = self.get_tarifa()
             coste = kwh_consumidos * tarifa
+            self.active_session.coste = coste
+            self.total_kwh += kwh_consumidos
             
             if self.descontar_saldo(coste):
-                print(f"Cobrado: {coste:.2f}€ ({kwh_consumidos:.2f} kWh a {tarifa}€/kWh)")
+                self.total_gastado += coste
+                logger.info("Cobrado: %.2f€ (%.2f kWh a %s€/kWh)", coste, kwh_consumidos, tarifa)
             else:
-                print(f"Saldo insuficiente. Coste: {coste:.2f}€, Saldo: {self.saldo:.2f}€")
+                logger.warning("Saldo insuficiente. Coste: %.2f€, Saldo: %.2f€", coste, self.saldo)
             
             # Guardar en historial
             self.sessions_history.append(self.active_session)
             
             self.active_session.charger.stop_charge()
-            print(f"{self.name} terminó su sesión.")
+            logger.info("%s terminó su sesión.", self.name)
             self.active_session = None
         else:
-            print(f"{self.name} no tiene ninguna sesión activa.")
+            logger.warning("%s no tiene ninguna sesión activa.", self.name)
 
     def get_historial_sesiones(self) -> list[Session]:
         """Devuelve el historial de sesiones del usuario"""
@@ -120,4 +162,8 @@ class User:
         """Compara usuarios por ID"""
         if isinstance(other, User):
             return self.id == other.id
-        return False
\ No newline at end of file
+        return False
+
+    def __hash__(self) -> int:
+        """Hash coherente con __eq__: el entero del UUID (misma clave que el registro)"""
+        return self.id.int
@@ -8,6 +8,8 @@ from pydantic import BaseModel, EmailStr, Field
 from typing import Optional
 from uuid import UUID
 
+from schemas.config import examples_config
+
 
 # ==================== SCHEMAS DE REGISTRO ====================
 
@@ -20,17 +22,15 @@ class UsuarioRegistro(BaseModel):
     saldo_inicial: float = Field(default=50.0, ge=0, description="Saldo inicial en €")
 
     model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "name": "María López",
-                    "email": "maria@voltedge.com",
-                    "password": "password123",
-                    "user_type": "individual",
-                    "saldo_inicial": 100.0
-                }
-            ]
-        }
+        **examples_config(
+            {
+                "name": "María López",
+                "email": "maria@voltedge.com",
+                "password": "password123",
+                "user_type": "individual",
+                "saldo_inicial": 100.0
+            }
+        ),
     }
 
 
@@ -44,18 +44,16 @@ class UsuarioRegistroResponse(BaseModel):
     mensaje: str = Field(..., description="Mensaje de confirmación")
 
     model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "id": "123e4567-e89b-12d3-a456-426614174000",
-                    "name": "María López",
-                    "email": "maria@voltedge.com",
-                    "user_type": "individual",
-                    "saldo": 100.0,
-                    "mensaje": "Usuario registrado exitosamente"
-                }
-            ]
-        }
+        **examples_config(
+            {
+                "id": "123e4567-e89b-12d3-a456-426614174000",
+                "name": "María López",
+                "email": "maria@voltedge.com",
+                "user_type": "individual",
+                "saldo": 100.0,
+                "mensaje": "Usuario registrado exitosamente"
+            }
+        ),
     }
 
 
@@ -67,14 +65,12 @@ class Token(BaseModel):
     token_type: str = Field(default="bearer", description="Tipo de token")
 
     model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
-                    "token_type": "bearer"
-                }
-            ]
-        }
+        **examples_config(
+            {
+                "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
+                "token_type": "bearer"
+            }
+        ),
     }
 
 
@@ -93,16 +89,20 @@ class UsuarioAutenticado(BaseModel):
     user_type: str = Field(..., description="Tipo de usuario")
     saldo: float = Field(..., description="Saldo actual en €")
 
+    @property
+    def is_admin(self) -> bool:
+        """Indica si el usuario es administrador (no se serializa)"""
+        return self.user_type == "admin"
+
     model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "id": "123e4567-e89b-12d3-a456-426614174000",
-                    "name": "María López",
-                    "email": "maria@voltedge.com",
-                    "user_type": "individual",
-                    "saldo": 85.50
-                }
-            ]
-        }
+        "from_attributes": True,
+        **examples_config(
+            {
+                "id": "123e4567-e89b-12d3-a456-426614174000",
+                "name": "María López",
+                "email": "maria@voltedge.com",
+                "user_type": "individual",
+                "saldo": 85.50
+            }
+        ),
     }
\ No newline at end of file
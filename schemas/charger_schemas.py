@@ -6,6 +6,8 @@ Esquemas Pydantic para cargadores.
 
 from pydantic import BaseModel, Field
 
+from schemas.config import examples_config
+
 
 # ==================== SCHEMAS DE CARGADOR ====================
 
@@ -15,14 +17,12 @@ class ChargerCreate(BaseModel):
     charger_type: str = Field(..., description="Tipo: 'rápido' o 'normal'")
 
     model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "charger_id": 101,
-                    "charger_type": "rápido"
-                }
-            ]
-        }
+        **examples_config(
+            {
+                "charger_id": 101,
+                "charger_type": "rápido"
+            }
+        ),
     }
 
 
@@ -33,15 +33,14 @@ class ChargerRead(BaseModel):
     status: str = Field(..., description="Estado: disponible/ocupado/mantenimiento")
 
     model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "id": 101,
-                    "type": "rápido",
-                    "status": "disponible"
-                }
-            ]
-        }
+        "from_attributes": True,
+        **examples_config(
+            {
+                "id": 101,
+                "type": "rápido",
+                "status": "disponible"
+            }
+        ),
     }
 
 
@@ -50,11 +49,9 @@ class IniciarCargaRequest(BaseModel):
     user_id: str = Field(..., description="ID del usuario (UUID)")
 
     model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "user_id": "123e4567-e89b-12d3-a456-426614174000"
-                }
-            ]
-        }
+        **examples_config(
+            {
+                "user_id": "123e4567-e89b-12d3-a456-426614174000"
+            }
+        ),
     }
\ No newline at end of file
@@ -0,0 +1,29 @@
+"""
+schemas/config.py - VoltEdge
+
+Configuración compartida por los esquemas Pydantic.
+"""
+
+import os
+
+
+# ==================== EJEMPLOS DE SWAGGER ====================
+
+# Los ejemplos solo sirven para la documentación interactiva (/docs).
+# En producción se pueden desactivar con VOLTEDGE_SCHEMA_EXAMPLES=0.
+EXAMPLES_ENABLED = os.getenv("VOLTEDGE_SCHEMA_EXAMPLES", "1") == "1"
+
+
+def examples_config(*examples: dict) -> dict:
+    """
+    Construye la parte de model_config con los ejemplos del esquema.
+
+    Args:
+        *examples: Ejemplos que se mostrarán en Swagger
+
+    Returns:
+        dict: {"json_schema_extra": {...}} o vacío si los ejemplos están desactivados
+    """
+    if not EXAMPLES_ENABLED:
+        return {}
+    return {"json_schema_extra": {"examples": list(examples)}}
@@ -7,6 +7,8 @@ Esquemas Pydantic para mantenimientos.
 from pydantic import BaseModel, Field
 from typing import Optional
 
+from schemas.config import examples_config
+
 
 # ==================== SCHEMAS DE MANTENIMIENTO ====================
 
@@ -21,18 +23,16 @@ class MaintenanceCreate(BaseModel):
     descripcion_fallo: Optional[str] = Field(None, description="Descripción del fallo (solo correctivo)")
 
     model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "id_mantenimiento": 5001,
-                    "station_id": 1,
-                    "fecha": "2024-12-20",
-                    "tecnico": "Técnico Ana",
-                    "tipo": "preventivo",
-                    "frecuencia": "mensual"
-                }
-            ]
-        }
+        **examples_config(
+            {
+                "id_mantenimiento": 5001,
+                "station_id": 1,
+                "fecha": "2024-12-20",
+                "tecnico": "Técnico Ana",
+                "tipo": "preventivo",
+                "frecuencia": "mensual"
+            }
+        ),
     }
 
 
@@ -49,21 +49,19 @@ class MaintenanceRead(BaseModel):
     descripcion_fallo: Optional[str] = Field(None, description="Fallo (correctivo)")
 
     model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "id_mantenimiento": 5001,
-                    "station_id": 1,
-                    "fecha": "2024-12-20",
-                    "tecnico": "Técnico Ana",
-                    "tipo": "preventivo",
-                    "estado": "programado",
-                    "notas": "",
-                    "frecuencia": "mensual",
-                    "descripcion_fallo": None
-                }
-            ]
-        }
+        **examples_config(
+            {
+                "id_mantenimiento": 5001,
+                "station_id": 1,
+                "fecha": "2024-12-20",
+                "tecnico": "Técnico Ana",
+                "tipo": "preventivo",
+                "estado": "programado",
+                "notas": "",
+                "frecuencia": "mensual",
+                "descripcion_fallo": None
+            }
+        ),
     }
 
 
@@ -72,11 +70,9 @@ class CompletarMaintenanceRequest(BaseModel):
     notas: str = Field(default="", description="Notas del mantenimiento completado")
 
     model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "notas": "Revisión completa. Todo OK. Próxima revisión en 3 meses."
-                }
-            ]
-        }
+        **examples_config(
+            {
+                "notas": "Revisión completa. Todo OK. Próxima revisión en 3 meses."
+            }
+        ),
     }
\ No newline at end of file
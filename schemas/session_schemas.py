@@ -9,6 +9,8 @@ from typing import Optional
 from uuid import UUID
 from datetime import datetime
 
+from schemas.config import examples_config
+
 
 # ==================== SCHEMAS DE SESIÓN ====================
 
@@ -18,14 +20,12 @@ class SessionCreate(BaseModel):
     station_id: int = Field(..., gt=0, description="ID de la estación")
 
     model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "user_id": "123e4567-e89b-12d3-a456-426614174000",
-                    "station_id": 1
-                }
-            ]
-        }
+        **examples_config(
+            {
+                "user_id": "123e4567-e89b-12d3-a456-426614174000",
+                "station_id": 1
+            }
+        ),
     }
 
 
@@ -42,21 +42,19 @@ class SessionRead(BaseModel):
     activa: bool = Field(..., description="Sesión activa o finalizada")
 
     model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "user_id": "123e4567-e89b-12d3-a456-426614174000",
-                    "user_name": "María López",
-                    "charger_id": 101,
-                    "start_time": "2024-12-11 10:30:00",
-                    "end_time": "2024-12-11 11:15:00",
-                    "duration_minutes": 45,
-                    "kwh_consumidos": 22.5,
-                    "coste": 6.75,
-                    "activa": False
-                }
-            ]
-        }
+        **examples_config(
+            {
+                "user_id": "123e4567-e89b-12d3-a456-426614174000",
+                "user_name": "María López",
+                "charger_id": 101,
+                "start_time": "2024-12-11 10:30:00",
+                "end_time": "2024-12-11 11:15:00",
+                "duration_minutes": 45,
+                "kwh_consumidos": 22.5,
+                "coste": 6.75,
+                "activa": False
+            }
+        ),
     }
 
 
@@ -65,11 +63,9 @@ class CerrarSessionRequest(BaseModel):
     user_id: UUID = Field(..., description="ID del usuario")
 
     model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "user_id": "123e4567-e89b-12d3-a456-426614174000"
-                }
-            ]
-        }
+        **examples_config(
+            {
+                "user_id": "123e4567-e89b-12d3-a456-426614174000"
+            }
+        ),
     }
\ No newline at end of file
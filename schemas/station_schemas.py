@@ -7,6 +7,8 @@ Esquemas Pydantic para estaciones de carga.
 from pydantic import BaseModel, Field
 from typing import List
 
+from schemas.config import examples_config
+
 
 # ==================== SCHEMAS DE ESTACIÓN ====================
 
@@ -17,15 +19,13 @@ class StationCreate(BaseModel):
     location: str = Field(..., min_length=1, description="Ubicación de la estación")
 
     model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "id": 1,
-                    "name": "Estación Centro Vigo",
-                    "location": "Calle Príncipe 25, Vigo"
-                }
-            ]
-        }
+        **examples_config(
+            {
+                "id": 1,
+                "name": "Estación Centro Vigo",
+                "location": "Calle Príncipe 25, Vigo"
+            }
+        ),
     }
 
 
@@ -35,6 +35,8 @@ class ChargerInfo(BaseModel):
     type: str = Field(..., description="Tipo de cargador")
     status: str = Field(..., description="Estado del cargador")
 
+    model_config = {"from_attributes": True}
+
 
 class StationRead(BaseModel):
     """Schema para leer una estación"""
@@ -46,21 +48,19 @@ class StationRead(BaseModel):
     chargers: List[ChargerInfo] = Field(default=[], description="Lista de cargadores")
 
     model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "id": 1,
-                    "name": "Estación Centro Vigo",
-                    "location": "Calle Príncipe 25, Vigo",
-                    "total_chargers": 4,
-                    "disponibles": 2,
-                    "chargers": [
-                        {"id": 101, "type": "rápido", "status": "disponible"},
-                        {"id": 102, "type": "normal", "status": "ocupado"}
-                    ]
-                }
-            ]
-        }
+        **examples_config(
+            {
+                "id": 1,
+                "name": "Estación Centro Vigo",
+                "location": "Calle Príncipe 25, Vigo",
+                "total_chargers": 4,
+                "disponibles": 2,
+                "chargers": [
+                    {"id": 101, "type": "rápido", "status": "disponible"},
+                    {"id": 102, "type": "normal", "status": "ocupado"}
+                ]
+            }
+        ),
     }
 
 
@@ -74,18 +74,16 @@ class StationDisponibilidad(BaseModel):
     porcentaje_disponibilidad: float = Field(..., description="% de disponibilidad")
 
     model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "station_id": 1,
-                    "station_name": "Estación Centro Vigo",
-                    "total_chargers": 4,
-                    "disponibles": 2,
-                    "ocupados": 2,
-                    "porcentaje_disponibilidad": 50.0
-                }
-            ]
-        }
+        **examples_config(
+            {
+                "station_id": 1,
+                "station_name": "Estación Centro Vigo",
+                "total_chargers": 4,
+                "disponibles": 2,
+                "ocupados": 2,
+                "porcentaje_disponibilidad": 50.0
+            }
+        ),
     }
 
 
@@ -97,14 +95,12 @@ class StationConsumo(BaseModel):
     sesiones_activas: int = Field(..., description="Sesiones activas ahora")
 
     model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "station_id": 1,
-                    "station_name": "Estación Centro Vigo",
-                    "total_sesiones": 156,
-                    "sesiones_activas": 2
-                }
-            ]
-        }
+        **examples_config(
+            {
+                "station_id": 1,
+                "station_name": "Estación Centro Vigo",
+                "total_sesiones": 156,
+                "sesiones_activas": 2
+            }
+        ),
     }
\ No newline at end of file
@@ -7,6 +7,8 @@ Esquemas Pydantic para gestión de usuarios.
 from pydantic import BaseModel, EmailStr, Field
 from uuid import UUID
 
+from schemas.config import examples_config
+
 
 # ==================== SCHEMAS DE USUARIO ====================
 
@@ -18,20 +20,23 @@ class UserRead(BaseModel):
     user_type: str = Field(..., description="Tipo: individual, empresa o admin")
     saldo: float = Field(..., description="Saldo disponible en €")
     tarifa_kwh: float = Field(..., description="Tarifa aplicada en €/kWh")
+    total_kwh: float = Field(..., description="kWh consumidos en sesiones finalizadas")
+    total_gastado: float = Field(..., description="Importe cobrado en sesiones finalizadas (€)")
 
     model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "id": "123e4567-e89b-12d3-a456-426614174000",
-                    "name": "María López",
-                    "email": "maria@voltedge.com",
-                    "user_type": "individual",
-                    "saldo": 85.50,
-                    "tarifa_kwh": 0.30
-                }
-            ]
-        }
+        "from_attributes": True,
+        **examples_config(
+            {
+                "id": "123e4567-e89b-12d3-a456-426614174000",
+                "name": "María López",
+                "email": "maria@voltedge.com",
+                "user_type": "individual",
+                "saldo": 85.50,
+                "tarifa_kwh": 0.30,
+                "total_kwh": 42.5,
+                "total_gastado": 12.75
+            }
+        ),
     }
 
 
@@ -40,13 +45,11 @@ class RecargaSaldo(BaseModel):
     cantidad: float = Field(..., gt=0, description="Cantidad a recargar en €")
 
     model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "cantidad": 50.0
-                }
-            ]
-        }
+        **examples_config(
+            {
+                "cantidad": 50.0
+            }
+        ),
     }
 
 
@@ -59,15 +62,13 @@ class RecargaSaldoResponse(BaseModel):
     mensaje: str = Field(..., description="Mensaje de confirmación")
 
     model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "user_id": "123e4567-e89b-12d3-a456-426614174000",
-                    "saldo_anterior": 35.50,
-                    "cantidad_recargada": 50.0,
-                    "saldo_nuevo": 85.50,
-                    "mensaje": "Saldo recargado exitosamente"
-                }
-            ]
-        }
+        **examples_config(
+            {
+                "user_id": "123e4567-e89b-12d3-a456-426614174000",
+                "saldo_anterior": 35.50,
+                "cantidad_recargada": 50.0,
+                "saldo_nuevo": 85.50,
+                "mensaje": "Saldo recargado exitosamente"
+            }
+        ),
     }
\ No newline at end of file
@@ -7,10 +7,22 @@ Servicio de autenticación que maneja:
 - Extracción de datos del token
 """
 
-from datetime import datetime, timedelta
-from typing import Optional
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+import base64
+import hashlib
+import hmac
+import json
+import os
+import platform
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+import jwt
+import orjson
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 
 # ==================== CONFIGURACIÓN ====================
 
@@ -18,8 +30,148 @@ SECRET_KEY = "voltedge_secret_key_change_in_production_2024"
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60  # Token válido por 1 hora
 
-# Contexto de Argon2 (mejor que bcrypt, sin límite de 72 bytes)
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
+# Caché LRU de tokens decodificados (clave: SHA-256 del token, nunca el token en claro)
+TOKEN_CACHE_MAXSIZE = 10_000
+TOKEN_CACHE_TTL_SECONDS = 60
+
+# Parámetros de Argon2id (mejor que bcrypt, sin límite de 72 bytes)
+ARGON2_TIME_COST = 3
+ARGON2_MEMORY_COST = 65536  # KiB
+ARGON2_PARALLELISM = max(1, (os.cpu_count() or 2) // 2)
+
+# Calibración opcional de Argon2 para el hardware donde se despliega
+ARGON2_AUTOTUNE = os.getenv("ARGON2_AUTOTUNE", "0") == "1"
+ARGON2_TARGET_SECONDS = (0.090, 0.110)  # Rango objetivo por hash
+ARGON2_MIN_MEMORY_COST = 8192  # KiB
+ARGON2_MAX_TIME_COST = 64
+ARGON2_PARAMS_FILE = Path(__file__).with_name("argon2_params.json")
+
+
+# ==================== CALIBRACIÓN DE ARGON2 ====================
+
+def _measure_argon2(time_cost: int, memory_cost: int, parallelism: int) -> float:
+    """Devuelve los segundos que tarda un hash con los parámetros dados."""
+    hasher = PasswordHasher(time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism)
+    start = time.perf_counter()
+    hasher.hash("voltedge-calibration")
+    return time.perf_counter() - start
+
+
+def _calibrate_argon2() -> Dict[str, int]:
+    """
+    Busca parámetros de Argon2 que tarden entre 90 y 110 ms en esta máquina.
+    
+    Parte de m=19456 KiB, t=2, p=1, ajusta t por bisección y termina
+    afinando m (el coste crece de forma aproximadamente lineal con m).
+    
+    Returns:
+        Diccionario con time_cost, memory_cost y parallelism
+    """
+    target_min, target_max = ARGON2_TARGET_SECONDS
+    time_cost, memory_cost, parallelism = 2, 19456, 1
+    elapsed = _measure_argon2(time_cost, memory_cost, parallelism)
+    
+    if elapsed > target_max:
+        # Incluso con t mínimo es lento: reducir memoria a la mitad
+        time_cost = 1
+        elapsed = _measure_argon2(time_cost, memory_cost, parallelism)
+        while elapsed > target_max and memory_cost // 2 >= ARGON2_MIN_MEMORY_COST:
+            memory_cost //= 2
+            elapsed = _measure_argon2(time_cost, memory_cost, parallelism)
+    else:
+        # Duplicar t hasta pasarse del objetivo y después bisecar
+        low, high = time_cost, time_cost
+        while elapsed < target_min and high < ARGON2_MAX_TIME_COST:
+            low, high = high, min(high * 2, ARGON2_MAX_TIME_COST)
+            elapsed = _measure_argon2(high, memory_cost, parallelism)
+        time_cost = high
+        
+        while high - low > 1 and not target_min <= elapsed <= target_max:
+            mid = (low + high) // 2
+            elapsed_mid = _measure_argon2(mid, memory_cost, parallelism)
+            if elapsed_mid < target_min:
+                low = mid
+            else:
+                high = mid
+                time_cost, elapsed = mid, elapsed_mid
+    
+    if not target_min <= elapsed <= target_max:
+        target = (target_min + target_max) / 2
+        memory_cost = max(ARGON2_MIN_MEMORY_COST, int(memory_cost * target / elapsed))
+    
+    return {"time_cost": time_cost, "memory_cost": memory_cost, "parallelism": parallelism}
+
+
+def _cpu_key() -> str:
+    """
+    Identificador de la CPU para la caché de calibración.
+    
+    En Linux platform.processor() suele estar vacío, así que se lee el
+    modelo de /proc/cpuinfo; se añade el número de CPUs porque también
+    influye en el coste del hash.
+    """
+    model = ""
+    try:
+        with open("/proc/cpuinfo", encoding="utf-8") as cpuinfo:
+            for line in cpuinfo:
+                if line.startswith("model name"):
+                    model = line.split(":", 1)[1].strip()
+                    break
+    except OSError:
+        pass
+    
+    model = model or platform.processor() or platform.machine() or "unknown"
+    return f"{model} ({os.cpu_count() or 1} CPUs)"
+
+
+def _valid_argon2_params(entry: object) -> bool:
+    """Comprueba que una entrada guardada tenga exactamente los tres parámetros enteros"""
+    return (
+        isinstance(entry, dict)
+        and set(entry) == {"time_cost", "memory_cost", "parallelism"}
+        and all(type(value) is int and value > 0 for value in entry.values())
+    )
+
+
+def _argon2_params() -> Dict[str, int]:
+    """
+    Parámetros con los que se construye el PasswordHasher.
+    
+    Con ARGON2_AUTOTUNE=1 se calibran una vez por CPU y se guardan en
+    ARGON2_PARAMS_FILE, de modo que los reinicios reutilizan el resultado.
+    """
+    if not ARGON2_AUTOTUNE:
+        return {
+            "time_cost": ARGON2_TIME_COST,
+            "memory_cost": ARGON2_MEMORY_COST,
+            "parallelism": ARGON2_PARALLELISM
+        }
+    
+    cpu_key = _cpu_key()
+    
+    try:
+        saved = json.loads(ARGON2_PARAMS_FILE.read_text())
+    except (OSError, ValueError):
+        saved = {}
+    if not isinstance(saved, dict):
+        saved = {}
+    
+    # Una entrada malformada o editada a mano se recalibra en lugar de romper el arranque
+    if _valid_argon2_params(saved.get(cpu_key)):
+        return saved[cpu_key]
+    
+    params = _calibrate_argon2()
+    saved[cpu_key] = params
+    
+    try:
+        ARGON2_PARAMS_FILE.write_text(json.dumps(saved, indent=2))
+    except OSError:
+        pass  # Sin permisos de escritura: se recalibrará en el próximo arranque
+    
+    return params
+
+
+password_hasher = PasswordHasher(**_argon2_params())
 
 
 # ==================== HASHING DE CONTRASEÑAS ====================
@@ -34,10 +186,7 @@ def hash_password(password: str) -> str:
     Returns:
         Hash de la contraseña
     """
-    # Truncar a 72 bytes por seguridad (aunque Argon2 no tiene este límite)
-    password_bytes = password.encode('utf-8')[:72]
-    password_truncated = password_bytes.decode('utf-8', errors='ignore')
-    return pwd_context.hash(password_truncated)
+    return password_hasher.hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -52,15 +201,45 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         True si coincide, False en caso contrario
     """
     try:
-        password_bytes = plain_password.encode('utf-8')[:72]
-        password_truncated = password_bytes.decode('utf-8', errors='ignore')
-        return pwd_context.verify(password_truncated, hashed_password)
-    except Exception:
+        return password_hasher.verify(hashed_password, plain_password)
+    except (VerificationError, InvalidHashError):
         return False
 
 
+# Hash de referencia generado al arrancar (nunca coincide con una contraseña real)
+_DUMMY_HASH = password_hasher.hash(os.urandom(16).hex())
+
+
+def verify_dummy_password(plain_password: str) -> None:
+    """
+    Ejecuta una verificación Argon2 cuyo resultado se descarta.
+    
+    Se usa cuando el email no existe, para que el login tarde lo mismo que
+    con una contraseña incorrecta y no revele qué emails están registrados.
+    
+    Args:
+        plain_password: Contraseña en texto plano recibida en el login
+    """
+    verify_password(plain_password, _DUMMY_HASH)
+
+
 # ==================== TOKENS JWT ====================
 
+_token_cache: "OrderedDict[bytes, Tuple[str, float]]" = OrderedDict()
+_token_cache_lock = threading.Lock()
+
+
+def _b64url(data: bytes) -> bytes:
+    """Codifica en base64url sin relleno, como exige JWT."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+# Firma HS256 precalculada: la cabecera es constante y el contexto HMAC con
+# la clave ya cargada se copia en cada token en vez de reconstruirse.
+_JWT_HEADER_B64 = _b64url(orjson.dumps({"alg": ALGORITHM, "typ": "JWT"}))
+_HMAC_TEMPLATE = hmac.new(SECRET_KEY.encode(), digestmod=hashlib.sha256)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """
     Crea un token JWT firmado.
@@ -75,34 +254,65 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     to_encode = data.copy()
     
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = datetime.now(timezone.utc) + expires_delta
     else:
-        expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+        expire = datetime.now(timezone.utc) + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    
+    to_encode.update({"exp": int(expire.timestamp())})
     
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    payload_b64 = _b64url(orjson.dumps(to_encode))
+    signing_input = _JWT_HEADER_B64 + b"." + payload_b64
     
-    return encoded_jwt
+    mac = _HMAC_TEMPLATE.copy()
+    mac.update(signing_input)
+    
+    return (signing_input + b"." + _b64url(mac.digest())).decode("ascii")
 
 
 def decode_access_token(token: str) -> Optional[str]:
     """
     Decodifica un token JWT y extrae el email del usuario.
     
+    Los tokens válidos se guardan en una caché LRU acotada para no repetir
+    la verificación de la firma en cada petición del mismo cliente. Cada
+    entrada guarda (email, caducidad) y nunca sobrevive al exp del token.
+    
     Args:
         token: Token JWT
         
     Returns:
         Email del usuario si el token es válido, None si no lo es
     """
+    key = hashlib.sha256(token.encode()).digest()
+    now = time.time()
+    
+    with _token_cache_lock:
+        cached = _token_cache.get(key)
+        if cached is not None:
+            if now < cached[1]:
+                _token_cache.move_to_end(key)
+                return cached[0]
+            del _token_cache[key]
+    
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        email: str = payload.get("sub")
-        
-        if email is None:
-            return None
-        
-        return email
+    except jwt.PyJWTError:
+        return None
+    
+    email: str = payload.get("sub")
+    
+    if email is None:
+        return None
+    
+    expires_at = now + TOKEN_CACHE_TTL_SECONDS
+    if "exp" in payload:
+        expires_at = min(expires_at, payload["exp"])
+    
+    with _token_cache_lock:
+        _token_cache[key] = (email, expires_at)
+        _token_cache.move_to_end(key)
+        if len(_token_cache) > TOKEN_CACHE_MAXSIZE:
+            # Descartar la entrada usada hace más tiempo
+            _token_cache.popitem(last=False)
     
-    except JWTError:
-        return None
\ No newline at end of file
+    return email
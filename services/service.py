@@ -4,24 +4,47 @@ services/service.py - VoltEdge
 Servicio principal actualizado para usar diccionarios y soportar autenticación.
 """
 
-from typing import Dict, List, Optional
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
 from uuid import UUID
 from models.station import Station
 from models.charger import Charger
 from models.user import User
 from models.session import Session
 from models.maintenance import Maintenance, PreventiveMaintenance, CorrectiveMaintenance
-from .auth_service import hash_password, verify_password
+from .auth_service import hash_password, verify_dummy_password, verify_password
+
+logger = logging.getLogger(__name__)
 
 
 class ChargingService:
     def __init__(self):
-        # Usar diccionarios para mejor rendimiento en búsquedas
+        # Usar diccionarios para mejor rendimiento en búsquedas.
+        # Usuarios y sesiones se indexan por UUID.int: hashear un int es
+        # directo, mientras que UUID.__hash__ es un método en Python.
         self.stations: Dict[int, Station] = {}
         self.chargers: Dict[int, Charger] = {}
-        self.users: Dict[UUID, User] = {}
-        self.sessions: Dict[UUID, Session] = {}
+        self.users: Dict[int, User] = {}
+        self.sessions: Dict[int, Session] = {}
+        # Sesiones activas por estación (contador, para no recorrer self.sessions)
+        self.active_sessions_per_station: Dict[int, int] = {}
         self.maintenances: Dict[int, Maintenance] = {}
+        # Mantenimientos por estación (id de estación -> {id: mantenimiento}, en orden de alta)
+        self.maintenances_by_station: Dict[int, Dict[int, Maintenance]] = {}
+        # Índice de usuarios por email en minúsculas (login y registro en O(1))
+        self.users_by_email: Dict[str, User] = {}
+        # Instantáneas inmutables para los listados (None = hay que reconstruirlas)
+        self._stations_snapshot: Optional[Tuple[Station, ...]] = None
+        self._chargers_snapshot: Optional[Tuple[Charger, ...]] = None
+        # Emails con un registro en curso (reservados mientras se hashea la contraseña)
+        self._pending_emails: Set[str] = set()
+        self._register_lock = threading.Lock()
+        # Protege los cambios de estado de cargadores y los contadores de sesiones
+        # (FastAPI ejecuta los endpoints síncronos en un pool de hilos)
+        self._sessions_lock = threading.Lock()
 
     # ==================== AUTENTICACIÓN ====================
 
@@ -49,24 +72,35 @@ class ChargingService:
         Raises:
             ValueError: Si el email ya está registrado
         """
-        # Verificar email duplicado
-        if self.get_user_by_email(email):
-            raise ValueError(f"El email {email} ya está registrado.")
+        email_key = email.lower()
         
-        # Hashear contraseña
-        password_hash = hash_password(password)
+        # Verificar email duplicado (sin distinguir mayúsculas) y reservarlo,
+        # para que dos registros simultáneos no hasheen ni creen el mismo usuario
+        with self._register_lock:
+            if email_key in self.users_by_email or email_key in self._pending_emails:
+                raise ValueError(f"El email {email} ya está registrado.")
+            self._pending_emails.add(email_key)
         
-        # Crear usuario
-        user = User(
-            name=name, 
-            email=email, 
-            password_hash=password_hash, 
-            user_type=user_type,
-            saldo=saldo_inicial
-        )
+        try:
+            # Hashear contraseña (fuera del lock: es la parte cara)
+            password_hash = hash_password(password)
+            
+            # Crear usuario
+            user = User(
+                name=name, 
+                email=email, 
+                password_hash=password_hash, 
+                user_type=user_type,
+                saldo=saldo_inicial
+            )
+            
+            self.users[user.id.int] = user
+            self.users_by_email[email_key] = user
+        finally:
+            with self._register_lock:
+                self._pending_emails.discard(email_key)
         
-        self.users[user.id] = user
-        print(f"Usuario '{name}' registrado ({user_type}) con saldo inicial {saldo_inicial}€")
+        logger.info("Usuario '%s' registrado (%s) con saldo inicial %s€", name, user_type, saldo_inicial)
         return user
 
     def authenticate_user(self, email: str, password: str) -> Optional[User]:
@@ -83,6 +117,8 @@ class ChargingService:
         user = self.get_user_by_email(email)
         
         if not user:
+            # Mismo coste que una contraseña incorrecta (no revela qué emails existen)
+            verify_dummy_password(password)
             return None
         
         if not verify_password(password, user.password_hash):
@@ -90,16 +126,38 @@ class ChargingService:
         
         return user
 
+    def authenticate_users_batch(self, creds: List[Tuple[str, str]]) -> List[Optional[User]]:
+        """
+        Autentica varios usuarios a la vez repartiendo Argon2 entre hilos.
+        
+        Argon2 libera el GIL durante el hash, así que las verificaciones se
+        ejecutan en paralelo (útil al cargar datos de simulación).
+        
+        Args:
+            creds: Lista de pares (email, contraseña en texto plano)
+            
+        Returns:
+            Lista en el mismo orden con el usuario o None por cada credencial
+        """
+        if not creds:
+            return []
+        
+        emails, passwords = zip(*creds)
+        workers = min(len(creds), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(self.authenticate_user, emails, passwords))
+
     def get_user_by_email(self, email: str) -> Optional[User]:
-        """Busca un usuario por email"""
-        for user in self.users.values():
-            if user.email == email:
-                return user
-        return None
+        """
+        Busca un usuario por email.
+        
+        La búsqueda no distingue mayúsculas de minúsculas.
+        """
+        return self.users_by_email.get(email.lower())
 
     def get_user_by_id(self, user_id: UUID) -> Optional[User]:
         """Busca un usuario por ID"""
-        return self.users.get(user_id)
+        return self.users.get(user_id.int)
 
     # ==================== GESTIÓN DE ESTACIONES ====================
 
@@ -107,24 +165,42 @@ class ChargingService:
         """Crea una nueva estación de carga"""
         station = Station(id, name, location)
         self.stations[id] = station
-        print(f"Estación '{name}' creada en {location}")
+        self._stations_snapshot = None
+        logger.info("Estación '%s' creada en %s", name, location)
         return station
 
     def get_station(self, station_id: int) -> Optional[Station]:
         """Obtiene una estación por ID"""
         return self.stations.get(station_id)
 
-    def list_stations(self) -> List[Station]:
-        """Lista todas las estaciones"""
-        return list(self.stations.values())
+    def list_stations(self) -> Tuple[Station, ...]:
+        """
+        Lista todas las estaciones.
+        
+        Devuelve una tupla compartida que solo se reconstruye tras crear o
+        eliminar estaciones.
+        """
+        if self._stations_snapshot is None:
+            self._stations_snapshot = tuple(self.stations.values())
+        return self._stations_snapshot
 
     def delete_station(self, station_id: int) -> bool:
-        """Elimina una estación (solo admin)"""
-        if station_id in self.stations:
-            del self.stations[station_id]
-            print(f"Estación {station_id} eliminada")
-            return True
-        return False
+        """Elimina una estación (solo admin) junto con sus cargadores del índice"""
+        with self._sessions_lock:
+            station = self.stations.pop(station_id, None)
+            if station is None:
+                return False
+            
+            for charger in station.chargers:
+                # Solo si el índice apunta a este cargador (otro puede reutilizar el id)
+                if self.chargers.get(charger.id) is charger:
+                    del self.chargers[charger.id]
+            self.active_sessions_per_station.pop(station_id, None)
+        
+        self._stations_snapshot = None
+        self._chargers_snapshot = None
+        logger.info("Estación %s eliminada", station_id)
+        return True
 
     # ==================== GESTIÓN DE CARGADORES ====================
 
@@ -132,68 +208,98 @@ class ChargingService:
         """Añade un cargador a una estación"""
         station = self.get_station(station_id)
         if not station:
-            print("Estación no encontrada.")
+            logger.warning("Estación no encontrada.")
             return None
         
         charger = Charger(charger_id, charger_type)
-        station.add_charger(charger)
-        self.chargers[charger_id] = charger
-        print(f"Cargador {charger_id} ({charger_type}) añadido a {station.name}")
+        with self._sessions_lock:
+            station.add_charger(charger)
+            self.chargers[charger_id] = charger
+        self._chargers_snapshot = None
+        logger.info("Cargador %s (%s) añadido a %s", charger_id, charger_type, station.name)
         return charger
 
     def get_charger(self, charger_id: int) -> Optional[Charger]:
         """Obtiene un cargador por ID"""
         return self.chargers.get(charger_id)
 
-    def list_chargers(self) -> List[Charger]:
-        """Lista todos los cargadores"""
-        return list(self.chargers.values())
+    def list_chargers(self) -> Tuple[Charger, ...]:
+        """
+        Lista todos los cargadores.
+        
+        Devuelve una tupla compartida que solo se reconstruye tras añadir o
+        eliminar cargadores.
+        """
+        if self._chargers_snapshot is None:
+            self._chargers_snapshot = tuple(self.chargers.values())
+        return self._chargers_snapshot
 
     # ==================== GESTIÓN DE SESIONES ====================
 
     def start_charging(self, user_id: UUID, station_id: int) -> Optional[Session]:
         """Inicia una sesión de carga"""
-        user = self.get_user_by_id(user_id)
+        user = self.users.get(user_id.int)
         station = self.get_station(station_id)
 
         if not user:
-            print("Usuario no encontrado.")
+            logger.warning("Usuario no encontrado.")
             return None
         
         if not station:
-            print("Estación no encontrada.")
+            logger.warning("Estación no encontrada.")
             return None
 
-        available = station.get_available_chargers()
-        if not available:
-            print(f"No hay cargadores disponibles en {station.name}.")
-            return None
+        # Elegir cargador, ocuparlo y contar la sesión es una sola transición
+        with self._sessions_lock:
+            charger = station.first_available_charger()
+            if charger is None:
+                logger.warning("No hay cargadores disponibles en %s.", station.name)
+                return None
 
-        charger = available[0]
-        session = user.start_session(charger)
-        
-        if session:
-            self.sessions[session.user.id] = session
+            session = user.start_session(charger)
+            
+            if session:
+                anterior = self.sessions.get(user_id.int)
+                if anterior is not None:
+                    # La sesión sustituida deja de contar en su estación
+                    self._descontar_sesion_activa(anterior)
+                self.sessions[user_id.int] = session
+                self.active_sessions_per_station[station_id] = self.active_sessions_per_station.get(station_id, 0) + 1
         
         return session
 
     def end_charging(self, user_id: UUID) -> bool:
         """Finaliza la sesión de carga de un usuario"""
-        user = self.get_user_by_id(user_id)
+        user = self.users.get(user_id.int)
         if not user:
-            print("Usuario no encontrado.")
+            logger.warning("Usuario no encontrado.")
             return False
         
-        user.end_session()
-        
-        if user_id in self.sessions:
-            del self.sessions[user_id]
+        with self._sessions_lock:
+            user.end_session()
+            
+            session = self.sessions.pop(user_id.int, None)
+            if session is not None:
+                self._descontar_sesion_activa(session)
         
         return True
 
+    def _descontar_sesion_activa(self, session: Session) -> None:
+        """
+        Resta una sesión cerrada del contador de su estación.
+        
+        Se llama con self._sessions_lock adquirido.
+        
+        Si la estación se eliminó (y quizá se recreó con el mismo id), la
+        sesión pertenece a la estación antigua y no debe tocar el contador.
+        """
+        station = self.stations.get(session.station_id)
+        if station is not None and session.charger.station is station:
+            self.active_sessions_per_station[session.station_id] -= 1
+
     def get_user_sessions_history(self, user_id: UUID) -> List[Session]:
         """Obtiene el historial de sesiones de un usuario"""
-        user = self.get_user_by_id(user_id)
+        user = self.users.get(user_id.int)
         if not user:
             return []
         return user.get_historial_sesiones()
@@ -202,13 +308,22 @@ class ChargingService:
 
     def recargar_saldo_usuario(self, user_id: UUID, cantidad: float) -> bool:
         """Recarga saldo a un usuario"""
-        user = self.get_user_by_id(user_id)
+        user = self.users.get(user_id.int)
         if not user:
             return False
         return user.recargar_saldo(cantidad)
 
     # ==================== MANTENIMIENTO ====================
 
+    def _registrar_mantenimiento(self, m: Maintenance) -> None:
+        """Guarda un mantenimiento y lo indexa por estación"""
+        anterior = self.maintenances.get(m.id_mantenimiento)
+        if anterior is not None:
+            # Un id reutilizado no debe seguir listado en su estación anterior
+            self.maintenances_by_station.get(anterior.estacion_id, {}).pop(m.id_mantenimiento, None)
+        self.maintenances[m.id_mantenimiento] = m
+        self.maintenances_by_station.setdefault(m.estacion_id, {})[m.id_mantenimiento] = m
+
     def programar_mantenimiento_preventivo(
         self, 
         id_mantenimiento: int, 
@@ -220,8 +335,8 @@ class ChargingService:
         """Programa un mantenimiento preventivo"""
         m = PreventiveMaintenance(id_mantenimiento, fecha, tecnico, frecuencia)
         m.asignar_estacion(station_id)
-        self.maintenances[id_mantenimiento] = m
-        print(m.programar())
+        self._registrar_mantenimiento(m)
+        m.programar()
         return m
 
     def programar_mantenimiento_correctivo(
@@ -235,32 +350,78 @@ class ChargingService:
         """Programa un mantenimiento correctivo"""
         m = CorrectiveMaintenance(id_mantenimiento, fecha, tecnico, descripcion_fallo)
         m.asignar_estacion(station_id)
-        self.maintenances[id_mantenimiento] = m
-        print(m.programar())
+        self._registrar_mantenimiento(m)
+        m.programar()
         return m
 
+    def programar_mantenimientos_bulk(self, specs: List[dict]) -> List[Maintenance]:
+        """
+        Programa muchos mantenimientos de una vez (p. ej. al dar de alta un despliegue).
+        
+        Registra un único mensaje de resumen en lugar de uno por mantenimiento.
+        
+        Args:
+            specs: Diccionarios con id_mantenimiento, station_id, fecha, tecnico,
+                tipo ('preventivo' o 'correctivo') y frecuencia o descripcion_fallo
+            
+        Returns:
+            Mantenimientos creados, en el mismo orden que specs
+            
+        Raises:
+            ValueError: Si a algún spec le falta un campo obligatorio, su tipo no es
+                'preventivo' ni 'correctivo' o no trae la frecuencia (preventivo) o
+                la descripción del fallo (correctivo). El mensaje indica el índice
+                del spec y no se registra ningún mantenimiento.
+        """
+        # Se construyen todos antes de registrar: un spec inválido no deja altas a medias
+        creados: List[Maintenance] = []
+        for i, spec in enumerate(specs):
+            for campo in ("id_mantenimiento", "station_id", "fecha", "tecnico", "tipo"):
+                if campo not in spec:
+                    raise ValueError(f"Spec {i}: falta el campo '{campo}'")
+            
+            tipo = spec["tipo"]
+            if tipo == "preventivo":
+                if not spec.get("frecuencia"):
+                    raise ValueError(f"Spec {i}: la frecuencia es obligatoria para mantenimientos preventivos")
+                m = PreventiveMaintenance(spec["id_mantenimiento"], spec["fecha"], spec["tecnico"], spec["frecuencia"])
+            elif tipo == "correctivo":
+                if not spec.get("descripcion_fallo"):
+                    raise ValueError(f"Spec {i}: la descripción del fallo es obligatoria para mantenimientos correctivos")
+                m = CorrectiveMaintenance(spec["id_mantenimiento"], spec["fecha"], spec["tecnico"], spec["descripcion_fallo"])
+            else:
+                raise ValueError(f"Spec {i}: tipo de mantenimiento no válido: {tipo}")
+            m.asignar_estacion(spec["station_id"])
+            creados.append(m)
+        
+        for m in creados:
+            self._registrar_mantenimiento(m)
+        
+        logger.info("%d mantenimientos programados", len(creados))
+        return creados
+
     def iniciar_mantenimiento(self, id_mantenimiento: int) -> Optional[Maintenance]:
         """Inicia un mantenimiento"""
         m = self.maintenances.get(id_mantenimiento)
         if not m:
-            print("Mantenimiento no encontrado.")
+            logger.warning("Mantenimiento no encontrado.")
             return None
-        print(m.iniciar())
+        m.iniciar()
         return m
 
     def completar_mantenimiento(self, id_mantenimiento: int, notas: str = "") -> Optional[Maintenance]:
         """Completa un mantenimiento"""
         m = self.maintenances.get(id_mantenimiento)
         if not m:
-            print("Mantenimiento no encontrado.")
+            logger.warning("Mantenimiento no encontrado.")
             return None
-        print(m.marcar_completado(notas))
+        m.marcar_completado(notas)
         return m
 
     def listar_mantenimientos(self, station_id: Optional[int] = None) -> List[Maintenance]:
         """Lista mantenimientos, opcionalmente filtrados por estación"""
-        if station_id:
-            return [m for m in self.maintenances.values() if m.estacion_id == station_id]
+        if station_id is not None:
+            return list(self.maintenances_by_station.get(station_id, {}).values())
         return list(self.maintenances.values())
 
     def get_mantenimiento(self, id_mantenimiento: int) -> Optional[Maintenance]:
@@ -276,7 +437,7 @@ class ChargingService:
             return {"error": "Estación no encontrada"}
         
         total = len(station.chargers)
-        disponibles = len(station.get_available_chargers())
+        disponibles = station.count_available()
         ocupados = total - disponibles
         
         return {
@@ -285,7 +446,7 @@ class ChargingService:
             "total_chargers": total,
             "disponibles": disponibles,
             "ocupados": ocupados,
-            "porcentaje_disponibilidad": (disponibles / total * 100) if total > 0 else 0
+            "porcentaje_disponibilidad": 100.0 * disponibles / total if total else 0.0
         }
 
     def get_station_consumo(self, station_id: int) -> dict:
@@ -295,11 +456,9 @@ class ChargingService:
             return {"error": "Estación no encontrada"}
         
         # Simular datos de consumo
-        total_sesiones = len([s for s in self.sessions.values() if s.charger in station.chargers])
-        
         return {
             "station_id": station_id,
             "station_name": station.name,
-            "total_sesiones": total_sesiones,
-            "sesiones_activas": len([c for c in station.chargers if c.status == "ocupado"])
+            "total_sesiones": self.active_sessions_per_station.get(station_id, 0),
+            "sesiones_activas": station.count_busy()
         }
\ No newline at end of file